@@ -1,11 +1,16 @@
 from django.conf import settings
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
+from fitness_tracker.users.api.views import FitnessProfileViewSet, UserViewSet
+
 if settings.DEBUG:
     router = DefaultRouter()
 else:
     router = SimpleRouter()
 
+router.register("users", UserViewSet)
+router.register("fitness-profiles", FitnessProfileViewSet)
+
 
 app_name = "api"
 urlpatterns = router.urls
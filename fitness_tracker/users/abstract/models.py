@@ -1,9 +1,18 @@
+import re
+
 from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+_MOBILE_RE = re.compile(r'^\d{10}$')
+_MOBILE_VALIDATOR = RegexValidator(
+    regex=_MOBILE_RE,
+    message='Enter a valid 10-digit mobile number.',
+    code='invalid_mobile_number'
+)
+
 
-class GenderChoices:
+class GenderChoices(models.TextChoices):
     """
         A class defining choices for gender in a Django model.
 
@@ -16,33 +25,25 @@ class GenderChoices:
         class YourModel(models.Model):
             gender = models.CharField(
                 max_length=1,
-                choices=YourModelChoices.GENDER_CHOICES,
-                default=YourModelChoices.MALE,
+                choices=GenderChoices.choices,
+                default=GenderChoices.MALE,
             )
         ```
 
         Attributes:
-            MALE: A string representing the 'Male' gender option.
-            FEMALE: A string representing the 'Female' gender option.
-            OTHER: A string representing the 'Other' gender option.
-            PREFER_NOT_TO_SAY: A string representing the 'Prefer Not to Say' option.
-            CHOICES: A tuple of tuples containing all available gender choices.
+            MALE: The 'Male' gender option.
+            FEMALE: The 'Female' gender option.
+            OTHER: The 'Other' gender option.
+            PREFER_NOT_TO_SAY: The 'Prefer Not to Say' option.
 
     """
-    MALE = "M"
-    FEMALE = "F"
-    OTHER = "O"
-    PREFER_NOT_TO_SAY = "N"
+    MALE = "M", _("Male")
+    FEMALE = "F", _("Female")
+    OTHER = "O", _("Other")
+    PREFER_NOT_TO_SAY = "N", _("Prefer Not to Say")
 
-    CHOICES = (
-        (MALE, _("Male")),
-        (FEMALE, _("Female")),
-        (OTHER, _("Other")),
-        (PREFER_NOT_TO_SAY, _("Prefer Not to Say"))
-    )
 
-
-class FitnessGoalChoices:
+class FitnessGoalChoices(models.TextChoices):
     """
         A class defining choices for fitness goals in a Django model.
 
@@ -55,33 +56,24 @@ class FitnessGoalChoices:
         class FitnessProfile(models.Model):
             goal = models.CharField(
                 max_length=2,
-                choices=FitnessGoalChoices.CHOICES,
+                choices=FitnessGoalChoices.choices,
                 default=FitnessGoalChoices.GENERAL_FITNESS,
             )
         ```
 
         Attributes:
-            WEIGHT_LOSS: A string representing the 'Weight Loss' fitness goal.
-            GENERAL_FITNESS: A string representing the 'General Fitness' goal.
-            SPORTS_FITNESS: A string representing the 'Sports Fitness' goal.
-            WEIGHT_GAIN: A string representing the 'Weight Gain' fitness goal.
-            BODY_RECOMPOSITION: A string representing the 'Body Recomposition' goal.
-            CHOICES: A tuple of tuples containing all available fitness goal choices.
+            WEIGHT_LOSS: The 'Weight Loss' fitness goal.
+            GENERAL_FITNESS: The 'General Fitness' goal.
+            SPORTS_FITNESS: The 'Sports Fitness' goal.
+            WEIGHT_GAIN: The 'Weight Gain' fitness goal.
+            BODY_RECOMPOSITION: The 'Body Recomposition' goal.
 
         """
-    WEIGHT_LOSS = "WL"
-    GENERAL_FITNESS = "GF"
-    SPORTS_FITNESS = "SF"
-    WEIGHT_GAIN = "WG"
-    BODY_RECOMPOSITION = "BR"
-
-    CHOICES = (
-        (WEIGHT_LOSS, _("Weight Loss")),
-        (GENERAL_FITNESS, _("General Fitness")),
-        (SPORTS_FITNESS, _("Sports Fitness")),
-        (WEIGHT_GAIN, _("Weight Gain")),
-        (BODY_RECOMPOSITION, _("Body Recomposition"))
-    )
+    WEIGHT_LOSS = "WL", _("Weight Loss")
+    GENERAL_FITNESS = "GF", _("General Fitness")
+    SPORTS_FITNESS = "SF", _("Sports Fitness")
+    WEIGHT_GAIN = "WG", _("Weight Gain")
+    BODY_RECOMPOSITION = "BR", _("Body Recomposition")
 
 
 class MobileNumberField(models.CharField):
@@ -100,17 +92,11 @@ class MobileNumberField(models.CharField):
         ```
 
         Attributes:
-            default_validators: A list of default validators including
-                a regex validator for 10-digit numbers.
+            default_validators: A list holding the shared module-level
+                regex validator for 10-digit numbers.
 
     """
-    default_validators = [
-        RegexValidator(
-            regex=r'^\d{10}$',
-            message='Enter a valid 10-digit mobile number.',
-            code='invalid_mobile_number'
-        ),
-    ]
+    default_validators = [_MOBILE_VALIDATOR]
 
     def __init__(self, *args, **kwargs):
         """
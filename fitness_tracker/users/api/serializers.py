@@ -1,5 +1,7 @@
+import uuid
+
 from django.contrib.auth import get_user_model
-from django.utils.crypto import get_random_string
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
 from fitness_tracker.users.models import FitnessProfile
@@ -10,10 +12,36 @@ User = get_user_model()
 class FitnessProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = FitnessProfile
-        fields = "__all__"
+        fields = (
+            "id",
+            "gender",
+            "date_of_birth",
+            "age",
+            "contact_number",
+            "height",
+            "weight",
+            "bmi",
+            "goal",
+            "joining_date",
+        )
+        read_only_fields = ("age", "bmi")
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ["username", "name", "url"]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:user-detail", "lookup_field": "username"},
+        }
 
 
 class CreateUserSerializer(serializers.ModelSerializer):
+    username_attempts = 3
+
+    # Reads `user.fitness_profile` for every instance; list querysets should
+    # select_related("fitness_profile") to avoid a query per user.
     fitness_profile = FitnessProfileSerializer()
 
     class Meta:
@@ -23,16 +51,18 @@ class CreateUserSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         fitness_profile = validated_data.pop("fitness_profile")
 
-        random_username = self.generate_random_username()
-        user = self.Meta.model.objects.create(username=random_username, **validated_data)
-
-        FitnessProfile.objects.create(user=user, **fitness_profile)
-        return user
+        # Rely on the unique constraint instead of querying for username collisions up
+        # front. One atomic block covers both inserts and doubles as the savepoint that
+        # is rolled back and retried when the generated username is taken.
+        for attempt in range(self.username_attempts):
+            try:
+                with transaction.atomic():
+                    user = self.Meta.model.objects.create(username=self.generate_random_username(), **validated_data)
+                    FitnessProfile.objects.create(user=user, **fitness_profile)
+                return user
+            except IntegrityError:
+                if attempt == self.username_attempts - 1:
+                    raise
 
     def generate_random_username(self):
-        while True:
-            random_username = get_random_string(length=16)
-            if not self.Meta.model.objects.filter(username=random_username).exists():
-                break
-
-        return random_username
+        return uuid.uuid4().hex
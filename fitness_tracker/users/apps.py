@@ -1,3 +1,6 @@
+from importlib import import_module
+from importlib.util import find_spec
+
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
@@ -7,7 +10,7 @@ class UsersConfig(AppConfig):
     verbose_name = _("Users")
 
     def ready(self):  # noqa
-        try:
-            import fitness_tracker.users.signals  # noqa: F401
-        except ImportError:
-            pass
+        # Only skip the import when there is no signals module; errors raised
+        # while importing an existing one should surface instead of being hidden.
+        if find_spec(f"{self.name}.signals") is not None:
+            import_module(f"{self.name}.signals")
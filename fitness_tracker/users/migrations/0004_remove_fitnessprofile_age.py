@@ -0,0 +1,16 @@
+# Generated by Django 4.1.9 on 2026-10-14 18:38
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0003_alter_fitnessprofile_user"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="fitnessprofile",
+            name="age",
+        ),
+    ]
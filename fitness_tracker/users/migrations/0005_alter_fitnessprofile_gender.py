@@ -0,0 +1,23 @@
+# Generated by Django 4.1.9 on 2026-10-14 18:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0004_remove_fitnessprofile_age"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="fitnessprofile",
+            name="gender",
+            field=models.CharField(
+                choices=[("M", "Male"), ("F", "Female"), ("O", "Other"), ("N", "Prefer Not to Say")],
+                default="M",
+                help_text="Select the gender of the user.",
+                max_length=1,
+                verbose_name="Gender",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.9 on 2026-10-14 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0005_alter_fitnessprofile_gender"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="fitnessprofile",
+            name="goal",
+            field=models.CharField(
+                choices=[
+                    ("WL", "Weight Loss"),
+                    ("GF", "General Fitness"),
+                    ("SF", "Sports Fitness"),
+                    ("WG", "Weight Gain"),
+                    ("BR", "Body Recomposition"),
+                ],
+                db_index=True,
+                default="GF",
+                help_text="Select the fitness goal of the user.",
+                max_length=2,
+                verbose_name="Fitness Goal",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.9 on 2026-10-14 18:47
+
+from django.db import migrations, models
+import django.db.models.functions.datetime
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0006_alter_fitnessprofile_goal"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="fitnessprofile",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    (
+                        "date_of_birth__lt",
+                        django.db.models.functions.datetime.TruncDate(django.db.models.functions.datetime.Now()),
+                    )
+                ),
+                name="fitness_profile_dob_in_past",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.9 on 2026-10-14 18:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0007_fitnessprofile_dob_in_past"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="fitnessprofile",
+            index=models.Index(
+                condition=models.Q(("joining_date__isnull", False)),
+                fields=["-joining_date"],
+                name="fp_joining_recent_idx",
+            ),
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import CharField
+from django.db.models.functions import Now, TruncDate
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -40,8 +41,8 @@ class FitnessProfile(models.Model):
     )
     gender = models.CharField(
         _("Gender"),
-        max_length=11,
-        choices=GenderChoices.CHOICES,
+        max_length=1,
+        choices=GenderChoices.choices,
         default=GenderChoices.MALE,
         help_text=_("Select the gender of the user.")
     )
@@ -50,12 +51,6 @@ class FitnessProfile(models.Model):
         validators=[validate_date_of_birth],
         help_text=_("Enter the date of birth of the user.")
     )
-    age = models.PositiveIntegerField(
-        _("Age in years"),
-        null=True,
-        blank=True,
-        help_text=_("The calculated age of the user in years.")
-    )
     contact_number = MobileNumberField(
         verbose_name=_("Mobile Number of the User"),
         help_text=_("Enter the mobile number of the user.")
@@ -89,18 +84,37 @@ class FitnessProfile(models.Model):
     goal = models.CharField(
         _("Fitness Goal"),
         max_length=2,
-        choices=FitnessGoalChoices.CHOICES,
+        choices=FitnessGoalChoices.choices,
         default=FitnessGoalChoices.GENERAL_FITNESS,
+        db_index=True,
         help_text=_("Select the fitness goal of the user.")
     )
 
-    def calculate_age(self) -> int:
+    class Meta:
+        constraints = [
+            # validate_date_of_birth gives API clients a friendly error; this keeps
+            # rows written outside the serializers consistent as well.
+            models.CheckConstraint(
+                check=models.Q(date_of_birth__lt=TruncDate(Now())), name="fitness_profile_dob_in_past"
+            ),
+        ]
+        indexes = [
+            # Recency lookups only ever care about profiles with a joining date.
+            models.Index(
+                fields=["-joining_date"],
+                name="fp_joining_recent_idx",
+                condition=models.Q(joining_date__isnull=False),
+            ),
+        ]
+
+    @property
+    def age(self) -> int:
         """
             Calculate the age of the person based on date of birth.
 
-            This method calculates the age of the person using the provided
-            date of birth and the current date. The result is rounded down
-            to the nearest whole year.
+            The age is derived from the date of birth and the current date
+            whenever it is read, so it never goes stale between saves. The
+            result is rounded down to the nearest whole year.
 
             Returns:
                 int: The calculated age of the person in years.
@@ -110,7 +124,7 @@ class FitnessProfile(models.Model):
                 is '2023-08-30', the calculated age will be 33.
 
         """
-        today = timezone.now().date()
+        today = timezone.localdate()
         delta = today - self.date_of_birth
         return delta.days // 365
 
@@ -119,23 +133,26 @@ class FitnessProfile(models.Model):
         Calculate the Body Mass Index (BMI) based on height and weight.
 
         BMI is calculated using the formula: weight (kg) / (height (m))^2.
-        The result is rounded to two decimal places.
+        Height is stored in centimeters, so the formula is evaluated as
+        weight * 10000 / height^2 on the integer values, and the result
+        is rounded to two decimal places.
 
         Returns:
             float: The calculated BMI.
 
         """
-        height_in_meters = self.height / 100
-        bmi = self.weight / (height_in_meters ** 2)
-        return round(bmi, 2)
+        return round(self.weight * 10000 / (self.height * self.height), 2)
 
     def save(
         self,
-        force_insert: bool = ...,
-        force_update: bool = ...,
-        using: str | None = ...,
-        update_fields: Iterable[str] | None = ...,
+        force_insert: bool = False,
+        force_update: bool = False,
+        using: str | None = None,
+        update_fields: Iterable[str] | None = None,
     ) -> None:
-        self.age = self.calculate_age()
-        self.bmi = self.calculate_bmi()
+        if update_fields is None:
+            self.bmi = self.calculate_bmi()
+        elif {"height", "weight"}.intersection(update_fields):
+            self.bmi = self.calculate_bmi()
+            update_fields = {"bmi", *update_fields}
         super().save(force_insert=force_insert, force_update=force_update, using=using, update_fields=update_fields)
@@ -1,10 +1,13 @@
 from collections.abc import Sequence
+from datetime import date
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from factory import Faker, post_generation
+from factory import Faker, SubFactory, post_generation
 from factory.django import DjangoModelFactory
 
+from fitness_tracker.users.models import FitnessProfile
+
 
 class UserFactory(DjangoModelFactory):
     username = Faker("user_name")
@@ -30,3 +33,14 @@ class UserFactory(DjangoModelFactory):
     class Meta:
         model = get_user_model()
         django_get_or_create = ["username"]
+
+
+class FitnessProfileFactory(DjangoModelFactory):
+    user = SubFactory(UserFactory)
+    date_of_birth = date(1990, 5, 15)
+    contact_number = Faker("numerify", text="##########")
+    height = 180
+    weight = 80
+
+    class Meta:
+        model = FitnessProfile
@@ -0,0 +1,56 @@
+from datetime import date
+from unittest import mock
+
+import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from fitness_tracker.users.api.serializers import CreateUserSerializer
+from fitness_tracker.users.models import FitnessProfile, User
+
+pytestmark = pytest.mark.django_db
+
+
+class TestCreateUserSerializer:
+    @pytest.fixture
+    def validated_data(self) -> dict:
+        return {
+            "name": "Test User",
+            "fitness_profile": {
+                "date_of_birth": date(1990, 5, 15),
+                "contact_number": "9876543210",
+                "height": 180,
+                "weight": 80,
+            },
+        }
+
+    def test_create_runs_one_savepoint_and_two_inserts(self, validated_data: dict):
+        serializer = CreateUserSerializer()
+
+        with CaptureQueriesContext(connection) as queries:
+            user = serializer.create(validated_data)
+
+        # SAVEPOINT, INSERT user, INSERT fitness profile, RELEASE SAVEPOINT
+        assert len(queries) == 4
+        assert [query["sql"].split()[0] for query in queries] == ["SAVEPOINT", "INSERT", "INSERT", "RELEASE"]
+        assert FitnessProfile.objects.filter(user=user).exists()
+
+    def test_create_retries_on_username_collision(self, user: User, validated_data: dict):
+        serializer = CreateUserSerializer()
+
+        with mock.patch.object(serializer, "generate_random_username", side_effect=[user.username, "fresh"]):
+            created = serializer.create(validated_data)
+
+        assert created.username == "fresh"
+        assert FitnessProfile.objects.filter(user=created).exists()
+
+    def test_create_raises_after_username_attempts(self, user: User, validated_data: dict):
+        serializer = CreateUserSerializer()
+
+        with mock.patch.object(serializer, "generate_random_username", return_value=user.username) as generate:
+            with pytest.raises(IntegrityError):
+                serializer.create(validated_data)
+
+        assert generate.call_count == serializer.username_attempts
+        assert User.objects.count() == 1
+        assert not FitnessProfile.objects.exists()
@@ -16,3 +16,8 @@ def test_user_list():
 def test_user_me():
     assert reverse("api:user-me") == "/api/users/me/"
     assert resolve("/api/users/me/").view_name == "api:user-me"
+
+
+def test_fitness_profile_list():
+    assert reverse("api:fitnessprofile-list") == "/api/fitness-profiles/"
+    assert resolve("/api/fitness-profiles/").view_name == "api:fitnessprofile-list"
@@ -1,8 +1,9 @@
 import pytest
 from rest_framework.test import APIRequestFactory
 
-from fitness_tracker.users.api.views import UserViewSet
+from fitness_tracker.users.api.views import FitnessProfileViewSet, UserViewSet
 from fitness_tracker.users.models import User
+from fitness_tracker.users.tests.factories import FitnessProfileFactory
 
 
 class TestUserViewSet:
@@ -33,3 +34,22 @@ class TestUserViewSet:
             "url": f"http://testserver/api/users/{user.username}/",
             "name": user.name,
         }
+
+
+class TestFitnessProfileViewSet:
+    @pytest.fixture
+    def api_rf(self) -> APIRequestFactory:
+        return APIRequestFactory()
+
+    def test_get_queryset(self, user: User, api_rf: APIRequestFactory):
+        profile = FitnessProfileFactory(user=user)
+        other_profile = FitnessProfileFactory()
+        view = FitnessProfileViewSet()
+        request = api_rf.get("/fake-url/")
+        request.user = user
+
+        view.request = request
+
+        queryset = view.get_queryset()
+        assert profile in queryset
+        assert other_profile not in queryset
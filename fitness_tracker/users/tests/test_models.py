@@ -1,5 +1,68 @@
-from fitness_tracker.users.models import User
+from datetime import date, timedelta
+from unittest import mock
+
+import pytest
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from fitness_tracker.users.models import FitnessProfile, User
+from fitness_tracker.users.tests.factories import FitnessProfileFactory
 
 
 def test_user_get_absolute_url(user: User):
     assert user.get_absolute_url() == f"/users/{user.username}/"
+
+
+def test_fitness_profile_age_is_derived_from_date_of_birth():
+    profile = FitnessProfile(date_of_birth=date(1990, 5, 15))
+    with mock.patch("django.utils.timezone.localdate", return_value=date(2023, 8, 30)):
+        assert profile.age == 33
+
+
+def test_fitness_profile_calculate_bmi():
+    profile = FitnessProfile(height=180, weight=80)
+    assert profile.calculate_bmi() == 24.69
+
+
+@pytest.mark.django_db
+class TestFitnessProfileSave:
+    def test_update_fields_with_height_writes_bmi(self):
+        profile = FitnessProfileFactory(height=180, weight=80)
+
+        profile.height = 160
+        profile.save(update_fields=["height"])
+
+        profile.refresh_from_db()
+        assert profile.bmi == 31.25
+
+    def test_update_fields_without_height_or_weight_keeps_bmi(self):
+        profile = FitnessProfileFactory(height=180, weight=80, goal="GF")
+
+        profile.height = 160
+        profile.goal = "WL"
+        profile.save(update_fields=["goal"])
+
+        profile.refresh_from_db()
+        assert profile.goal == "WL"
+        assert profile.height == 180
+        assert profile.bmi == 24.69
+
+    def test_positional_update_fields_writes_bmi(self):
+        profile = FitnessProfileFactory(height=180, weight=80)
+
+        profile.weight = 90
+        profile.save(False, False, None, ["weight"])
+
+        profile.refresh_from_db()
+        assert profile.bmi == 27.78
+
+
+@pytest.mark.django_db
+class TestFitnessProfileConstraints:
+    def test_date_of_birth_today_violates_constraint(self):
+        with pytest.raises(IntegrityError), transaction.atomic():
+            FitnessProfileFactory(date_of_birth=timezone.localdate())
+
+    def test_date_of_birth_yesterday_satisfies_constraint(self):
+        profile = FitnessProfileFactory(date_of_birth=timezone.localdate() - timedelta(days=1))
+        assert FitnessProfile.objects.filter(pk=profile.pk).exists()
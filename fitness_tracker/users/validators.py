@@ -26,7 +26,7 @@ def validate_date_of_birth(value: date) -> None:
         ```
 
     """
-    if value >= timezone.now().date():
+    if value >= timezone.localdate():
         raise ValidationError(
             detail={
                 "date_of_birth": _("Date of birth must be in the past."),